@@ -2,7 +2,195 @@ import sqlite3
 import os
 import logging
 import json
+import queue
+import threading
 import uuid
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
+
+# Bumped whenever init_database's DDL batch changes; databases stamped with
+# the current version skip the DDL entirely on startup.
+_SCHEMA_VERSION = 1
+
+# SQL statements hoisted to module scope so every call binds the same str
+# object. sqlite3's per-connection statement cache is keyed by the SQL text,
+# so reusing one canonical string guarantees cache hits instead of re-parsing.
+_SQL_ADD_TASK = """
+    INSERT INTO tasks (title, deadline, category, notes, priority)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_DELETE_TASK = 'DELETE FROM tasks WHERE id = ?'
+# The completed guard makes re-marking a done task a no-op that writes no
+# WAL frame at all.
+_SQL_MARK_COMPLETED = 'UPDATE tasks SET completed = 1 WHERE id = ? AND completed = 0'
+# Explicit column lists pin the row shape callers index into, instead of
+# inheriting whatever order SELECT * happens to produce after a schema change.
+_TASK_COLUMNS = 'id, title, completed, deadline, category, notes, priority, created_at'
+_SQL_GET_TASK = f'SELECT {_TASK_COLUMNS} FROM tasks WHERE id = ?'
+_SQL_GET_ALL_TASKS = f'SELECT {_TASK_COLUMNS} FROM tasks ORDER BY created_at DESC'
+_SQL_GET_TASK_NOTES = 'SELECT notes FROM tasks WHERE id = ?'
+_SQL_TASK_EXISTS = 'SELECT id FROM tasks WHERE id = ?'
+_SQL_ADD_LABEL = """
+    INSERT OR IGNORE INTO labels (name, color)
+    VALUES (?, ?)
+"""
+_SQL_GET_LABEL_BY_NAME = 'SELECT id FROM labels WHERE name = ?'
+# The no-op DO UPDATE makes RETURNING fire for an existing row as well, so
+# one statement covers both the insert and lookup cases.
+_SQL_ADD_LABEL_RETURNING = """
+    INSERT INTO labels (name, color) VALUES (?, ?)
+    ON CONFLICT(name) DO UPDATE SET name = name
+    RETURNING id
+"""
+# RETURNING needs SQLite 3.35+; older runtimes fall back to INSERT + SELECT.
+_SQLITE_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_SQL_GET_LABEL = 'SELECT id, name, color FROM labels WHERE id = ?'
+_SQL_LABEL_EXISTS = 'SELECT 1 FROM labels WHERE id = ?'
+_SQL_DELETE_LABEL = 'DELETE FROM labels WHERE id = ?'
+_SQL_CLEAR_TASK_LABELS = 'DELETE FROM task_labels WHERE task_id = ?'
+_SQL_GET_TASK_LABEL_IDS = 'SELECT label_id FROM task_labels WHERE task_id = ?'
+_SQL_GET_TASK_LABELS = '''
+    SELECT l.id, l.name, l.color
+    FROM tasks t
+    LEFT JOIN task_labels tl ON tl.task_id = t.id
+    LEFT JOIN labels l ON l.id = tl.label_id
+    WHERE t.id = ?
+'''
+_SQL_GET_ALL_LABELS = 'SELECT id, name, color FROM labels'
+_SQL_LINK_TASK_LABEL = 'INSERT OR IGNORE INTO task_labels (task_id, label_id) VALUES (?, ?)'
+_SQL_SET_TASK_LABELS_ADD = 'INSERT OR IGNORE INTO task_labels (task_id, label_id) VALUES (?, ?)'
+
+# Field order used to build the dynamic UPDATE statement. Each distinct
+# subset of fields is formatted once and cached under its bitmask over this
+# tuple, so repeated updates with the same field set reuse one SQL string
+# (and therefore the same cached prepared statement).
+_ALLOWED_UPDATE_ORDER = ('title', 'completed', 'deadline', 'category', 'notes', 'priority')
+_UPDATE_SQL_CACHE = {}
+
+# Characters that are rejected in database paths. The deletion table lets the
+# common no-bad-characters case run entirely in C via str.translate.
+_INVALID_PATH_CHARS = '<>"|?*&'
+_INVALID_PATH_TABLE = str.maketrans('', '', _INVALID_PATH_CHARS)
+
+# Validation tables, built once at import instead of per call.
+_VALID_PRIORITIES = {
+    'ASAP': 0,    # Highest priority
+    'HIGH': 1,    # High priority
+    'MEDIUM': 2,  # Medium priority
+    'LOW': 3,     # Low priority
+    'LOWEST': 4   # Lowest priority
+}
+_ALLOWED_UPDATES = {
+    'title': str,
+    'completed': bool,
+    'deadline': str,
+    'category': str,
+    'notes': str,
+    'priority': str
+}
+# Reverse mapping for the PRIORITY converter; index == stored code.
+_PRIORITY_NAMES = ('ASAP', 'HIGH', 'MEDIUM', 'LOW', 'LOWEST')
+
+
+def _resolve_log_dir():
+    """Pick a writable log directory: ./logs, then ~/logs, then cwd."""
+    try:
+        os.makedirs("logs", exist_ok=True)
+        return "logs"
+    except PermissionError:
+        try:
+            user_log_dir = os.path.join(os.path.expanduser("~"), "logs")
+            os.makedirs(user_log_dir, exist_ok=True)
+            return user_log_dir
+        except PermissionError:
+            # If both fail, use current directory
+            return "."
+
+
+def _get_logger():
+    """Return the module logger, attaching its handlers on first use.
+
+    Deferring handler construction keeps module import free of filesystem
+    syscalls, and attaching to this logger instead of the root keeps other
+    modules' records out of the database log file. The guard keeps reloads
+    and repeated instantiation from stacking duplicate handlers.
+    """
+    logger = logging.getLogger(__name__)
+    if not logger.handlers:
+        # time.strftime has no %f, so a datefmt with it would render a
+        # literal '%f'; the default format plus default_msec_format gets
+        # millisecond precision from logging's own cheap append path.
+        formatter = logging.Formatter(
+            '%(levelname)s [%(asctime)s] %(name)s - %(message)s [%(filename)s:%(lineno)d]')
+        formatter.default_msec_format = '%s.%03d'
+        file_handler = logging.FileHandler(
+            os.path.join(_resolve_log_dir(), 'productivity.log'))
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        logger.addHandler(file_handler)
+        logger.addHandler(stream_handler)
+        logger.setLevel(logging.INFO)
+    return logger
+
+
+@lru_cache(maxsize=None)
+def _ensure_writable_dir(db_dir):
+    """Create the database directory if it does not exist yet.
+
+    Cached per directory so repeated TodoDatabase instantiations pointing at
+    the same location skip the syscall. Writability is not probed here:
+    sqlite3.connect fails with a clear OperationalError when the directory
+    is unwritable, which __init__ translates to PermissionError.
+    """
+    os.makedirs(db_dir, exist_ok=True)
+
+
+# Type converters run inside sqlite3's C fetch loop, so declared-type columns
+# arrive in Python already coerced instead of being fixed up per row. BOOLEAN
+# covers tasks.completed; TIMESTAMP is overridden to keep created_at as the
+# stored text instead of letting the deprecated default converter build
+# datetime objects.
+sqlite3.register_converter("BOOLEAN", lambda value: value != b"0")
+sqlite3.register_converter("TIMESTAMP", lambda value: value.decode())
+# priority is stored as an INTEGER code so ORDER BY compares ints in the
+# VDBE; the converter rebuilds the API-level name during fetch.
+sqlite3.register_converter("PRIORITY", lambda value: _PRIORITY_NAMES[int(value)])
+
+
+# Levels accepted by PRAGMA synchronous; the value is interpolated into the
+# pragma statement, so anything else is rejected up front.
+_SYNCHRONOUS_LEVELS = frozenset(('OFF', 'NORMAL', 'FULL', 'EXTRA'))
+
+
+def _configure_connection(conn, synchronous='NORMAL'):
+    """Apply per-connection PRAGMA tuning.
+
+    journal_mode=WAL persists in the database file, but these settings are
+    connection-local state and must be re-asserted on every new connection.
+    NORMAL skips the per-commit fsync that FULL pays under WAL; callers that
+    need stronger durability pass FULL or EXTRA through TodoDatabase.
+    """
+    # foreign_keys drives the ON DELETE CASCADE cleanup of task_labels
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.execute(f"PRAGMA synchronous={synchronous}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA busy_timeout=5000")
+
+
+def _close_quietly(conn):
+    """Close a connection without raising.
+
+    Runs from a weakref finalizer, possibly during interpreter shutdown, so
+    failures are swallowed rather than logged.
+    """
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
 
 
 class DatabaseError(Exception):
@@ -37,171 +225,421 @@ class DatabaseError(Exception):
 class TodoDatabase:
     """Database management class for todo tasks."""
 
-    def __init__(self, db_file="todo.db"):
-        """Initialize database connection and set up logging."""
-        # Set up log directories
-        self.default_log_dir = "logs"
-        self.user_log_dir = os.path.join(os.path.expanduser("~"), "logs")
-        self.log_dir = None
+    def __init__(self, db_file="todo.db", synchronous="NORMAL"):
+        """Initialize the database connection state.
 
-        # Try default directory first
-        try:
-            os.makedirs(self.default_log_dir, exist_ok=True)
-            self.log_dir = self.default_log_dir
-        except PermissionError:
-            # Try user's home directory as fallback
-            try:
-                os.makedirs(self.user_log_dir, exist_ok=True)
-                self.log_dir = self.user_log_dir
-            except PermissionError:
-                # If both fail, use current directory
-                self.log_dir = "."
-
-        # Set up logging
-        log_file_path = os.path.join(self.log_dir, 'productivity.log')
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(levelname)s [%(asctime)s] %(name)s - %(message)s [%(filename)s:%(lineno)d]',
-            datefmt='%Y-%m-%d %H:%M:%S.%f',
-            handlers=[
-                logging.FileHandler(log_file_path),
-                logging.StreamHandler()
-            ]
-        )
-        self.log = logging.getLogger(__name__)
+        Args:
+            db_file (str): Path to the database file, or ":memory:".
+            synchronous (str): PRAGMA synchronous level for every connection
+                this instance opens. Defaults to NORMAL, which under WAL
+                drops the per-commit fsync; durability-sensitive callers can
+                pass FULL or EXTRA.
+
+        Raises:
+            DatabaseError: With code INVALID_VALUE if synchronous is not one
+                of OFF, NORMAL, FULL or EXTRA.
+        """
+        # Handlers attach on the first instantiation, not at import
+        self.log = _get_logger()
+
+        synchronous = str(synchronous).upper()
+        if synchronous not in _SYNCHRONOUS_LEVELS:
+            raise DatabaseError(
+                f"Invalid synchronous level: {synchronous}", "INVALID_VALUE")
+        self._synchronous = synchronous
+
+        # Writer connection state; the connection itself is opened lazily on
+        # first use so construction never leaves a handle open. The finalizer
+        # is registered when the connection is. Read-only connections live in
+        # their own pool so reads run concurrently with writes under WAL.
+        self._conn = None
+        self._finalizer = None
+        self._lock = threading.Lock()
+        self._readers = queue.Queue()
+
+        # Write-generation counters for the read caches below. Writers bump
+        # the relevant rev, which invalidates stale entries in O(1) because
+        # cache keys embed the rev they were read at.
+        self._tasks_rev = 0
+        self._labels_rev = 0
+        self._task_cache = {}
+        self._labels_cache = None
+        self._labels_cache_rev = -1
 
         # Initialize database
         if db_file is None:
             db_file = os.getenv('DB_PATH', 'todo.db')
 
-        # Validate database path
-        invalid_chars = '<>"|?*&'
-        if any(char in str(db_file) for char in invalid_chars):
-            self.log.error("Invalid characters in database path: %s",
-                           [c for c in str(db_file) if c in invalid_chars])
-            raise DatabaseError("Invalid characters in database path", "INVALID_PATH")
+        # In-memory databases have no backing directory to validate or create,
+        # and their URI parameters would trip the character check below.
+        is_memory = db_file == ":memory:" or str(db_file).startswith("file::memory:")
+        self._is_memory = is_memory
+        self._uri = str(db_file).startswith("file:")
+
+        if not is_memory:
+            # Validate database path; the per-character scan only runs on the
+            # failure branch to name the offending characters
+            path_str = str(db_file)
+            if len(path_str.translate(_INVALID_PATH_TABLE)) != len(path_str):
+                self.log.error("Invalid characters in database path: %s",
+                               [c for c in path_str if c in _INVALID_PATH_CHARS])
+                raise DatabaseError("Invalid characters in database path", "INVALID_PATH")
 
         self.db_file = db_file
-        db_dir = os.path.dirname(os.path.abspath(db_file))
 
         try:
-            if not os.path.exists(db_dir):
-                os.makedirs(db_dir, exist_ok=True)
-            if not os.access(db_dir, os.W_OK):
-                self.log.error("No write permission for database directory: %s", db_dir)
-                raise PermissionError(f"No write permission for database directory: {db_dir}")
-
-            with sqlite3.connect(self.db_file) as conn:
-                self.init_database(conn)
-                self.log.info("Database initialized successfully at %s", self.db_file)
+            if is_memory:
+                # An in-memory database lives and dies with its connection, so
+                # the schema has to be created on the shared writer itself; a
+                # throwaway connection would initialize a database that
+                # evaporates before the first query runs.
+                with self._lock:
+                    self.init_database(self._get_connection(),
+                                       synchronous=self._synchronous)
+            else:
+                _ensure_writable_dir(os.path.dirname(os.path.abspath(db_file)))
+                with sqlite3.connect(self.db_file) as conn:
+                    self.init_database(conn, synchronous=self._synchronous)
+            self.log.info("Database initialized successfully at %s", self.db_file)
+        except sqlite3.OperationalError as e:
+            # sqlite reports an unwritable or missing directory itself, so the
+            # constructor no longer probes with os.access up front.
+            self.log.error("Failed to initialize database: %s", str(e), exc_info=True)
+            raise PermissionError(f"Unable to open database file: {self.db_file}") from e
         except Exception as e:
             self.log.error("Failed to initialize database: %s", str(e), exc_info=True)
             raise
 
-        self._conn = None
+    def __enter__(self):
+        """Support use as a context manager for deterministic cleanup."""
+        return self
 
-    def __del__(self):
-        """Ensures database connection is closed when object is destroyed.
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the shared connection when the context exits."""
+        self.close()
 
-        Any errors during connection closure are logged but not raised,
-        as this method is called during garbage collection.
-        """
-        try:
-            if hasattr(self, '_conn') and self._conn:
-                self._conn.close()
-                self._conn = None
-        except Exception as e:
-            logging.error("Error closing database connection: %s: %s",
-                          type(e).__name__, str(e))
+    def generate_operation_id(self):
+        """Generate unique operation ID for tracking.
 
-    @staticmethod
-    def generate_operation_id():
-        """Generate unique operation ID for tracking."""
-        return str(uuid.uuid4())
+        uuid4 costs a getrandom syscall plus string formatting, and the ID
+        only ever appears in log records, so it is skipped entirely when no
+        record at INFO or below would be emitted.
+        """
+        if self.log.isEnabledFor(logging.INFO):
+            return str(uuid.uuid4())
+        return ""
 
     def _log_operation(self, operation, details, op_id):
-        """Log database operation with structured details."""
-        self.log.debug("Database operation [OperationID: %s] - %s: %s",
-                       op_id, operation, json.dumps(details))
+        """Log database operation with structured details.
+
+        The json.dumps serialization only runs when DEBUG records are
+        actually going to be emitted.
+        """
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("Database operation [OperationID: %s] - %s: %s",
+                           op_id, operation, json.dumps(details))
 
     @staticmethod
-    def init_database(conn):
+    def init_database(conn, synchronous='NORMAL'):
         """Initialize database tables if they don't exist."""
-        cursor = conn.cursor()
-        cursor.execute("""
+        # user_version stamps an initialized schema so restarts skip the DDL
+        # batch (and its sqlite_master introspection) entirely; only fresh or
+        # pre-stamp databases pay for it.
+        schema_version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if schema_version >= _SCHEMA_VERSION:
+            conn.execute("PRAGMA journal_mode=WAL")
+            _configure_connection(conn, synchronous)
+            return
+
+        # One executescript call parses and runs the whole DDL batch on the C
+        # side instead of a prepare/step round-trip per statement.
+        conn.executescript('''
             CREATE TABLE IF NOT EXISTS tasks (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 title TEXT NOT NULL,
-                completed BOOLEAN DEFAULT FALSE,
+                completed BOOLEAN NOT NULL DEFAULT 0 CHECK (completed IN (0, 1)),
                 deadline DATETIME,
                 category TEXT,
                 notes TEXT,
-                priority INTEGER,
+                priority PRIORITY CHECK (priority BETWEEN 0 AND 4 OR priority IS NULL),
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        cursor.execute('''
+            );
+
             CREATE TABLE IF NOT EXISTS labels (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 name TEXT UNIQUE NOT NULL,
                 color TEXT
-            )
-        ''')
-        cursor.execute('''
+            );
+
             CREATE TABLE IF NOT EXISTS task_labels (
                 task_id INTEGER,
                 label_id INTEGER,
-                FOREIGN KEY (task_id) REFERENCES tasks (id),
-                FOREIGN KEY (label_id) REFERENCES labels (id),
+                FOREIGN KEY (task_id) REFERENCES tasks (id) ON DELETE CASCADE,
+                FOREIGN KEY (label_id) REFERENCES labels (id) ON DELETE CASCADE,
                 PRIMARY KEY (task_id, label_id)
-            )
+            );
+
+            -- get_all_tasks sorts by created_at and delete_label filters the
+            -- junction table by label_id; without these indexes both fall
+            -- back to full scans. task_id lookups are already covered by the
+            -- primary key.
+            CREATE INDEX IF NOT EXISTS idx_tasks_created_at
+            ON tasks (created_at DESC);
+
+            CREATE INDEX IF NOT EXISTS idx_task_labels_label_id
+            ON task_labels (label_id);
+
+            -- Refresh planner statistics so the indexes above are actually
+            -- chosen once tables grow.
+            ANALYZE;
         ''')
-        cursor.close()
+
+        # One-shot migration for databases created before the PRIORITY
+        # decltype. CREATE TABLE IF NOT EXISTS leaves an existing tasks table
+        # with its original column declaration, and without the PRIORITY
+        # decltype the converter that restores priority names never fires, so
+        # those databases would hand back raw codes. Rebuild the table with
+        # the current declaration, translating stored names to codes in the
+        # copy. Foreign keys stay off for the script so dropping the old
+        # table cannot cascade into task_labels; the whole script is one
+        # transaction, so a failure leaves the legacy table untouched.
+        decltype = conn.execute(
+            "SELECT type FROM pragma_table_info('tasks') WHERE name = 'priority'"
+        ).fetchone()
+        if decltype and decltype[0].upper() != 'PRIORITY':
+            conn.executescript('''
+                PRAGMA foreign_keys=OFF;
+                BEGIN;
+                CREATE TABLE tasks_migrated (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    completed BOOLEAN NOT NULL DEFAULT 0 CHECK (completed IN (0, 1)),
+                    deadline DATETIME,
+                    category TEXT,
+                    notes TEXT,
+                    priority PRIORITY CHECK (priority BETWEEN 0 AND 4 OR priority IS NULL),
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+                INSERT INTO tasks_migrated
+                    (id, title, completed, deadline, category, notes, priority, created_at)
+                SELECT id, title, completed, deadline, category, notes,
+                    CASE priority
+                        WHEN 'ASAP' THEN 0 WHEN 'HIGH' THEN 1 WHEN 'MEDIUM' THEN 2
+                        WHEN 'LOW' THEN 3 WHEN 'LOWEST' THEN 4 ELSE priority END,
+                    created_at
+                FROM tasks;
+                DROP TABLE tasks;
+                ALTER TABLE tasks_migrated RENAME TO tasks;
+                CREATE INDEX IF NOT EXISTS idx_tasks_created_at
+                ON tasks (created_at DESC);
+                COMMIT;
+            ''')
+
+        # WAL avoids a full fsync and journal unlink per commit and lets
+        # readers proceed concurrently with a writer. journal_mode is
+        # persistent per database file and only needs asserting here; the
+        # connection-local settings come from _configure_connection.
+        conn.execute("PRAGMA journal_mode=WAL")
+        _configure_connection(conn, synchronous)
+
+        conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+
+
+    def _get_connection(self):
+        """Return the shared connection, opening it on first use.
+
+        Callers must hold self._lock.
+        """
+        if self._conn is None:
+            # check_same_thread is disabled because the connection is shared;
+            # self._lock serializes all access to it instead.
+            # isolation_level=None leaves transaction control to the
+            # explicit BEGIN IMMEDIATE in _connect()/bulk()
+            conn = sqlite3.connect(self.db_file, uri=self._uri,
+                                   check_same_thread=False,
+                                   detect_types=sqlite3.PARSE_DECLTYPES,
+                                   cached_statements=256,
+                                   isolation_level=None)
+            _configure_connection(conn, self._synchronous)
+            self._conn = conn
+            # A finalizer instead of __del__ keeps instances cheap to collect
+            # and cannot raise during interpreter shutdown.
+            self._finalizer = weakref.finalize(self, _close_quietly, conn)
+        return self._conn
+
+    @contextmanager
+    def _connect(self):
+        """Yield the writer connection inside a transaction, holding the lock.
+
+        Reusing one long-lived connection avoids reopening the database file,
+        re-reading the schema, and warming the pager cache on every call. The
+        connection runs in autocommit and each block is bracketed by an
+        explicit BEGIN IMMEDIATE, which takes the write lock up front so a
+        contending writer waits on busy_timeout instead of failing on a
+        deferred lock upgrade mid-transaction. The block commits on clean
+        exit and rolls back on error.
+        """
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except Exception:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+
+    @contextmanager
+    def _borrow_reader(self):
+        """Yield a read-only connection, creating one if the pool is empty.
+
+        Under WAL, read-only connections see the last committed state without
+        waiting on the writer, so reads borrow from this pool instead of
+        queueing behind self._lock. A connection that raises is closed rather
+        than repooled; the pool size is bounded by peak read concurrency.
+        """
+        if self._is_memory:
+            # A read-only URI would open a different, empty in-memory
+            # database, so memory databases read through the writer. The
+            # global lock is held for the whole borrow; generators must
+            # finish the borrow before yielding rows (see iter_all_tasks).
+            with self._connect() as conn:
+                yield conn
+            return
+
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = sqlite3.connect(f"file:{self.db_file}?mode=ro", uri=True,
+                                   check_same_thread=False,
+                                   detect_types=sqlite3.PARSE_DECLTYPES,
+                                   cached_statements=256)
+            _configure_connection(conn, self._synchronous)
+
+        try:
+            yield conn
+        except Exception:
+            _close_quietly(conn)
+            raise
+        else:
+            self._readers.put(conn)
+
+    def close(self):
+        """Close the writer connection and drain the reader pool."""
+        with self._lock:
+            while True:
+                try:
+                    _close_quietly(self._readers.get_nowait())
+                except queue.Empty:
+                    break
+            if self._conn is not None:
+                # Detach the finalizer first so garbage collection doesn't
+                # try to close the connection a second time.
+                if self._finalizer is not None:
+                    self._finalizer.detach()
+                    self._finalizer = None
+                try:
+                    # optimize refreshes planner statistics for whichever
+                    # indexes this session actually used, then the checkpoint
+                    # folds the WAL back into the database file now, while
+                    # teardown timing is deterministic, instead of leaving it
+                    # to whenever collection happens.
+                    self._conn.execute("PRAGMA optimize")
+                    self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                except sqlite3.Error:
+                    pass
+                self._conn.close()
+                self._conn = None
+
+    @contextmanager
+    def bulk(self):
+        """
+        Context manager that runs several writes as one explicit transaction.
+
+        Each write method normally pays its own transaction (and fsync) per
+        call. For multi-row work such as imports, this opens one connection,
+        issues BEGIN IMMEDIATE to take the write lock up front, and commits
+        once at the end, so N writes cost a single fsync instead of N.
+
+        Yields:
+            sqlite3.Cursor: A cursor on the transaction's connection.
+
+        Raises:
+            DatabaseError: With codes:
+                - DB_CONN_ERROR: If database connection fails
+                - DB_QUERY_ERROR: If a statement in the batch fails
+
+        Example:
+            with db.bulk() as cursor:
+                cursor.executemany(
+                    "INSERT INTO tasks (title) VALUES (?)", rows)
+        """
+        with self._lock:
+            try:
+                conn = self._get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+            except sqlite3.OperationalError as e:
+                self.log.error("Database connection error: %s", e)
+                raise DatabaseError("An error occurred while connecting to the database", "DB_CONN_ERROR") from e
+
+            try:
+                yield conn.cursor()
+                conn.commit()
+                # A bulk batch can touch anything; invalidate both caches
+                self._tasks_rev += 1
+                self._labels_rev += 1
+            except sqlite3.OperationalError as e:
+                conn.rollback()
+                self.log.error("Database connection error: %s", e)
+                raise DatabaseError("An error occurred while connecting to the database", "DB_CONN_ERROR") from e
+            except sqlite3.Error as e:
+                conn.rollback()
+                self.log.error("Error during bulk operation: %s", e)
+                raise DatabaseError("An error occurred during the bulk operation", "DB_QUERY_ERROR") from e
+            except Exception:
+                conn.rollback()
+                raise
 
     @staticmethod
     def _validate_priority(priority):
-        """Validates the priority value."""
-        VALID_PRIORITIES = {
-            'ASAP': 0,    # Highest priority
-            'HIGH': 1,    # High priority
-            'MEDIUM': 2,  # Medium priority
-            'LOW': 3,     # Low priority
-            'LOWEST': 4   # Lowest priority
-        }
-        if priority is not None and priority not in VALID_PRIORITIES:
-            raise DatabaseError("Invalid priority value", "INVALID_PRIORITY")
-        return VALID_PRIORITIES.get(priority)
+        """Validates the priority value and returns its INTEGER storage code."""
+        if priority is None:
+            return None
+        try:
+            return _VALID_PRIORITIES[priority]
+        except KeyError as err:
+            raise DatabaseError("Invalid priority value", "INVALID_PRIORITY") from err
 
     @staticmethod
     def _validate_title(title):
         """Validates the task title."""
         if title is None:
             raise DatabaseError("Title cannot be None", "INVALID_TITLE")
-        if title.strip() == "":
+        if not title.strip():
             raise DatabaseError("Title cannot be empty", "EMPTY_TITLE")
 
     def add_task(self, title, deadline=None, category=None, notes=None, priority=None):
         """Add a new task to the database."""
         op_id = self.generate_operation_id()
-        self._log_operation("add_task", {
-            "title": title,
-            "deadline": str(deadline) if deadline else None,
-            "category": category,
-            "notes": notes,
-            "priority": priority
-        }, op_id)
+        # Skip building the details dict entirely when DEBUG is off
+        if self.log.isEnabledFor(logging.DEBUG):
+            self._log_operation("add_task", {
+                "title": title,
+                "deadline": str(deadline) if deadline else None,
+                "category": category,
+                "notes": notes,
+                "priority": priority
+            }, op_id)
 
         try:
-            self._validate_priority(priority)
+            priority_code = self._validate_priority(priority)
             self._validate_title(title)
 
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO tasks (title, deadline, category, notes, priority)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (title, deadline, category, notes, priority))
+            with self._connect() as conn:
+                cursor = conn.execute(_SQL_ADD_TASK, (title, deadline, category, notes, priority_code))
                 task_id = cursor.lastrowid
+                self._tasks_rev += 1
                 self.log.info("Task created successfully [OperationID: %s, TaskID: %d]",
                               op_id, task_id)
                 return task_id
@@ -216,6 +654,55 @@ class TodoDatabase:
                            op_id, str(e), exc_info=True)
             raise
 
+    def add_tasks(self, tasks):
+        """
+        Adds several tasks to the database in a single transaction.
+
+        Validates every row up front, then inserts the whole batch with one
+        executemany call, so N rows cost one statement prepare and one commit
+        instead of N of each.
+
+        Args:
+            tasks (iterable): Task rows, each a sequence of
+                (title, deadline, category, notes, priority). Trailing fields
+                may be omitted and default to None.
+
+        Returns:
+            list: The IDs of the newly inserted tasks, in input order.
+
+        Raises:
+            DatabaseError: If validation fails for any row or the insert
+                fails. No rows are inserted unless the whole batch succeeds.
+        """
+        op_id = self.generate_operation_id()
+        rows = []
+        for task in tasks:
+            row = tuple(task) + (None,) * (5 - len(task))
+            self._validate_title(row[0])
+            # Bind the INTEGER code the priority column stores
+            rows.append(row[:4] + (self._validate_priority(row[4]),))
+
+        if not rows:
+            return []
+
+        self._log_operation("add_tasks", {"count": len(rows)}, op_id)
+
+        try:
+            with self._connect() as conn:
+                conn.executemany(_SQL_ADD_TASK, rows)
+                # Inside the lock and transaction the inserted rowids are
+                # contiguous, so the batch's IDs can be derived from the last.
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                self._tasks_rev += 1
+                self.log.info("Added %d tasks [OperationID: %s]", len(rows), op_id)
+                return list(range(last_id - len(rows) + 1, last_id + 1))
+        except sqlite3.OperationalError as e:
+            self.log.error("Database connection error [OperationID: %s]: %s", op_id, str(e))
+            raise DatabaseError("Database connection error", "DB_CONN_ERROR") from e
+        except sqlite3.Error as e:
+            self.log.error("Error adding tasks: %s", e)
+            raise DatabaseError("An error occurred while adding the tasks", "DB_QUERY_ERROR") from e
+
     def delete_task(self, task_id):
         """
         Deletes the task with the specified ID from the database.
@@ -226,45 +713,42 @@ class TodoDatabase:
         Raises:
             DatabaseError: If there is an error deleting the task or if the task does not exist.
         """
-        query = 'DELETE FROM tasks WHERE id = ?'
         op_id = self.generate_operation_id()
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (task_id,))
+            with self._connect() as conn:
+                cursor = conn.execute(_SQL_DELETE_TASK, (task_id,))
                 if cursor.rowcount == 0:
                     self.log.warning("Task not found [OperationID: %s, TaskID: %d]", op_id, task_id)
                     raise DatabaseError(f"No task found with ID {task_id}", "TASK_NOT_FOUND")
-                conn.commit()
+                self._tasks_rev += 1
         except sqlite3.OperationalError as e:
             self.log.error("Database connection error: %s", e)
             raise DatabaseError("An error occurred while connecting to the database", "DB_CONN_ERROR") from e
 
     def _validate_updates(self, updates):
         """Validates and filters update fields."""
-        ALLOWED_UPDATES = {
-            'title': str,
-            'completed': bool,
-            'deadline': str,
-            'category': str,
-            'notes': str,
-            'priority': str
-        }
-
-        validated_updates = {}
-        for field, value in updates.items():
-            if field not in ALLOWED_UPDATES:
-                continue
-
-            if not isinstance(value, ALLOWED_UPDATES[field]):
-                raise DatabaseError(f"Invalid value for field {field}", "INVALID_VALUE")
+        if not updates:
+            return {}
 
-            if field == 'title':
-                self._validate_title(value)
-            elif field == 'priority':
-                self._validate_priority(value)
+        # The key intersection runs in C and the comprehension builds the
+        # filtered dict in one pass instead of growing it field by field.
+        fields = updates.keys() & _ALLOWED_UPDATES.keys()
+        validated_updates = {field: updates[field] for field in fields}
 
-            validated_updates[field] = value
+        for field, value in validated_updates.items():
+            if not isinstance(value, _ALLOWED_UPDATES[field]):
+                raise DatabaseError(f"Invalid value for field {field}", "INVALID_VALUE")
+
+        # Per-field checks branch on key presence instead of once per field
+        if 'title' in validated_updates:
+            self._validate_title(validated_updates['title'])
+        if 'priority' in validated_updates:
+            # Bind the INTEGER code the priority column stores
+            validated_updates['priority'] = self._validate_priority(
+                validated_updates['priority'])
+        if 'completed' in validated_updates:
+            # Stored as INTEGER 0/1; bind explicit ints for a stable query plan
+            validated_updates['completed'] = int(validated_updates['completed'])
 
         return validated_updates
 
@@ -290,17 +774,27 @@ class TodoDatabase:
         if not validated_updates:
             raise DatabaseError("No valid updates provided", "NO_UPDATES")
 
+        mask = 0
+        for i, field in enumerate(_ALLOWED_UPDATE_ORDER):
+            if field in validated_updates:
+                mask |= 1 << i
+
+        query = _UPDATE_SQL_CACHE.get(mask)
+        if query is None:
+            set_clause = ', '.join(f"{field} = ?" for field in _ALLOWED_UPDATE_ORDER
+                                   if field in validated_updates)
+            # skipcq: BAN-B608
+            query = _UPDATE_SQL_CACHE.setdefault(mask, f'UPDATE tasks SET {set_clause} WHERE id = ?')
+
+        values = [validated_updates[field] for field in _ALLOWED_UPDATE_ORDER
+                  if field in validated_updates] + [task_id]
+
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
-                set_clause = ', '.join(f"{field} = ?" for field in validated_updates)
-                # skipcq: BAN-B608
-                query = f'UPDATE tasks SET {set_clause} WHERE id = ?'
-                values = list(validated_updates.values()) + [task_id]
-                cursor.execute(query, values)
+            with self._connect() as conn:
+                cursor = conn.execute(query, values)
                 if cursor.rowcount == 0:
                     raise DatabaseError(f"No task found with ID {task_id}", "TASK_NOT_FOUND")
-                conn.commit()
+                self._tasks_rev += 1
         except sqlite3.OperationalError as e:
             self.log.error("Database connection error: %s", e)
             raise DatabaseError("An error occurred while connecting to the database", "DB_CONN_ERROR") from e
@@ -318,13 +812,16 @@ class TodoDatabase:
         Raises:
             DatabaseError: If task not found or database error codes.
         """
-        query = 'UPDATE tasks SET completed = TRUE WHERE id = ?'
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (task_id,))
+            with self._connect() as conn:
+                cursor = conn.execute(_SQL_MARK_COMPLETED, (task_id,))
                 if cursor.rowcount == 0:
-                    raise DatabaseError(f"No task found with ID {task_id}", "TASK_NOT_FOUND")
+                    # Zero rows means either already completed (fine) or
+                    # missing; one existence probe tells them apart
+                    if conn.execute(_SQL_TASK_EXISTS, (task_id,)).fetchone() is None:
+                        raise DatabaseError(f"No task found with ID {task_id}", "TASK_NOT_FOUND")
+                else:
+                    self._tasks_rev += 1
         except sqlite3.OperationalError as e:
             self.log.error("Database connection error: %s", e)
             raise DatabaseError("An error occurred while connecting to the database", "DB_CONN_ERROR") from e
@@ -334,10 +831,16 @@ class TodoDatabase:
         op_id = self.generate_operation_id()
         self._log_operation("get_task", {"task_id": task_id}, op_id)
 
+        # The rev in the key makes entries from before the last task write
+        # unreachable, so hits are always current.
+        cache_key = (task_id, self._tasks_rev)
+        task = self._task_cache.get(cache_key)
+        if task is not None:
+            return task
+
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
-                cursor.execute('SELECT * FROM tasks WHERE id = ?', (task_id,))
+            with self._borrow_reader() as conn:
+                cursor = conn.execute(_SQL_GET_TASK, (task_id,))
                 task = cursor.fetchone()
 
                 if task is None:
@@ -347,9 +850,13 @@ class TodoDatabase:
 
                 self.log.info("Task retrieved successfully [OperationID: %s, TaskID: %d]",
                               op_id, task_id)
-                task_list = list(task)
-                task_list[2] = bool(task_list[2])
-                return tuple(task_list)
+                # Bounded cache; wholesale clearing on overflow keeps
+                # eviction O(1) without LRU bookkeeping
+                if len(self._task_cache) >= 256:
+                    self._task_cache.clear()
+                self._task_cache[cache_key] = task
+                # The BOOLEAN converter already coerced the completed column
+                return task
         except sqlite3.OperationalError as e:
             self.log.error("Database connection error: %s", e)
             raise DatabaseError("An error occurred while connecting to the database", "DB_CONN_ERROR") from e
@@ -358,23 +865,87 @@ class TodoDatabase:
                            op_id, str(e), exc_info=True)
             raise
 
-    def get_all_tasks(self):
+    def get_task_notes(self, task_id):
         """
-        Returns all tasks from the database, ordered by creation date in descending order.
+        Retrieves only the notes field for a task.
+
+        Notes can be large relative to the rest of the row, so callers that
+        just need the body text can fetch it on demand instead of carrying it
+        through every list query.
+
+        Args:
+            task_id (int): The ID of the task whose notes to fetch.
 
         Returns:
-            list: A list of tuples, where each tuple represents a task and contains the task's column values.
+            str or None: The task's notes, or None if none were set.
+
+        Raises:
+            DatabaseError: If the task does not exist or the connection fails.
         """
-        query = 'SELECT * FROM tasks ORDER BY created_at DESC'
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
-                cursor.execute(query)
-                return cursor.fetchall()
+            with self._borrow_reader() as conn:
+                row = conn.execute(_SQL_GET_TASK_NOTES, (task_id,)).fetchone()
+                if row is None:
+                    raise DatabaseError("Task not found", "TASK_NOT_FOUND")
+                return row[0]
         except sqlite3.OperationalError as e:
             self.log.error("Database connection error: %s", e)
             raise DatabaseError("An error occurred while connecting to the database", "DB_CONN_ERROR") from e
 
+    def iter_all_tasks(self):
+        """
+        Yields tasks one at a time, ordered by creation date in descending order.
+
+        Unlike get_all_tasks, this never materializes the full result list,
+        so callers that filter or stop early only pay for the rows they
+        actually consume. The borrowed read connection returns to the pool
+        only once the generator is exhausted or closed. Rows are pulled in
+        fixed fetchmany batches so the Python/C boundary is crossed once per
+        batch rather than once per row. In-memory databases are the
+        exception: their reads hold the writer lock, so the result is
+        materialized up front and streamed with the lock released.
+
+        Yields:
+            tuple: A task's column values.
+
+        Raises:
+            DatabaseError: If there is an error connecting to the database.
+        """
+        if self._is_memory:
+            # Memory databases read through the shared writer under
+            # self._lock, so a generator paused mid-borrow would sit on the
+            # lock and deadlock any call made while iterating. Materialize
+            # the result under the lock and yield only after releasing it.
+            try:
+                with self._borrow_reader() as conn:
+                    rows = conn.execute(_SQL_GET_ALL_TASKS).fetchall()
+            except sqlite3.OperationalError as e:
+                self.log.error("Database connection error: %s", e)
+                raise DatabaseError("An error occurred while connecting to the database", "DB_CONN_ERROR") from e
+            yield from rows
+            return
+
+        try:
+            with self._borrow_reader() as conn:
+                cursor = conn.execute(_SQL_GET_ALL_TASKS)
+                while True:
+                    rows = cursor.fetchmany(1000)
+                    if not rows:
+                        break
+                    yield from rows
+        except sqlite3.OperationalError as e:
+            self.log.error("Database connection error: %s", e)
+            raise DatabaseError("An error occurred while connecting to the database", "DB_CONN_ERROR") from e
+
+    def get_all_tasks(self):
+        """
+        Returns all tasks from the database, ordered by creation date in descending order.
+
+        Returns:
+            list: A list of tuples, where each tuple represents a task and contains the task's column values.
+        """
+        return list(self.iter_all_tasks())
+
     def add_label(self, name, color=None):  # skipcq: PYL-R1710
         """
         Adds a new label to the database or returns existing label ID.
@@ -402,20 +973,20 @@ class TodoDatabase:
             raise DatabaseError("Label name cannot be empty", "EMPTY_LABEL")
 
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
-                # Try to insert the new label
-                cursor.execute("""
-                    INSERT OR IGNORE INTO labels (name, color)
-                    VALUES (?, ?)
-                """, (name, color))
-
-                # Get the label_id (whether just inserted or already existed)
-                cursor.execute("SELECT id FROM labels WHERE name = ?", (name,))
-                result = cursor.fetchone()
+            with self._connect() as conn:
+                if _SQLITE_SUPPORTS_RETURNING:
+                    # One statement resolves both the new and existing cases
+                    result = conn.execute(_SQL_ADD_LABEL_RETURNING, (name, color)).fetchone()
+                else:
+                    # Try to insert the new label
+                    conn.execute(_SQL_ADD_LABEL, (name, color))
+
+                    # Get the label_id (whether just inserted or already existed)
+                    result = conn.execute(_SQL_GET_LABEL_BY_NAME, (name,)).fetchone()
 
                 if result:
                     label_id = result[0]
+                    self._labels_rev += 1
                     self.log.info("Label operation successful. Label ID: %d", label_id)
                     return label_id
 
@@ -439,11 +1010,9 @@ class TodoDatabase:
         Raises:
             DatabaseError: If the label with the specified ID is not found or database error occurs.
         """
-        query = 'SELECT * FROM labels WHERE id = ?'
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (label_id,))
+            with self._borrow_reader() as conn:
+                cursor = conn.execute(_SQL_GET_LABEL, (label_id,))
 
                 label = cursor.fetchone()
                 if label is None:
@@ -464,12 +1033,13 @@ class TodoDatabase:
             None
         """
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
-                cursor.execute('DELETE FROM task_labels WHERE label_id = ?', (label_id,))
-                cursor.execute('DELETE FROM labels WHERE id = ?', (label_id,))
-                if cursor.rowcount == 0:
+            with self._connect() as conn:
+                if conn.execute(_SQL_LABEL_EXISTS, (label_id,)).fetchone() is None:
                     raise DatabaseError(f"No label found with ID {label_id}", "LABEL_NOT_FOUND")
+                # ON DELETE CASCADE removes the task_labels rows inside the
+                # same statement, so no second DELETE round-trip is needed.
+                conn.execute(_SQL_DELETE_LABEL, (label_id,))
+                self._labels_rev += 1
         except sqlite3.OperationalError as e:
             self.log.error("Database connection error: %s", e)
             raise DatabaseError("An error occurred while connecting to the database", "DB_CONN_ERROR") from e
@@ -489,18 +1059,62 @@ class TodoDatabase:
             except DatabaseError as e:
                 print(f"Error: {e.message}, Code: {e.code}")
         """
-        query = "DELETE FROM task_labels WHERE task_id = ?"
-
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (task_id,))
+            with self._connect() as conn:
+                cursor = conn.execute(_SQL_CLEAR_TASK_LABELS, (task_id,))
                 if cursor.rowcount == 0:
                     raise DatabaseError(f"No task found with ID {task_id}", "TASK_NOT_FOUND")
         except sqlite3.OperationalError as e:
             self.log.error("Database connection error: %s", e)
             raise DatabaseError("An error occurred while connecting to the database", "DB_CONN_ERROR") from e
 
+    def set_task_labels(self, task_id, label_ids):
+        """
+        Replaces the set of labels linked to a task, touching only the delta.
+
+        Unlike calling clear_task_labels followed by link_task_label per label,
+        this diffs the requested label set against the current one and issues
+        at most one batched DELETE and one batched INSERT, all inside a single
+        transaction. Labels that are already correct are left untouched.
+
+        Args:
+            task_id (int): The ID of the task whose labels should be replaced.
+            label_ids (iterable): The label IDs the task should end up with.
+                An empty iterable removes all labels from the task.
+
+        Raises:
+            DatabaseError: With codes:
+                - TASK_NOT_FOUND: If no task exists with the given ID
+                - DB_CONN_ERROR: If database connection fails
+        """
+        new_labels = set(label_ids)
+
+        try:
+            with self._connect() as conn:
+                # Verify task exists before touching its links
+                if conn.execute(_SQL_TASK_EXISTS, (task_id,)).fetchone() is None:
+                    raise DatabaseError(f"No task found with ID {task_id}", "TASK_NOT_FOUND")
+
+                current_labels = {row[0] for row in
+                                  conn.execute(_SQL_GET_TASK_LABEL_IDS, (task_id,))}
+
+                to_delete = current_labels - new_labels
+                to_add = new_labels - current_labels
+
+                if to_delete:
+                    placeholders = ', '.join('?' * len(to_delete))
+                    # skipcq: BAN-B608
+                    conn.execute(
+                        f'DELETE FROM task_labels WHERE task_id = ? AND label_id IN ({placeholders})',
+                        (task_id, *to_delete))
+                if to_add:
+                    conn.executemany(
+                        _SQL_SET_TASK_LABELS_ADD,
+                        [(task_id, label_id) for label_id in to_add])
+        except sqlite3.OperationalError as e:
+            self.log.error("Database connection error: %s", e)
+            raise DatabaseError("An error occurred while connecting to the database", "DB_CONN_ERROR") from e
+
     def get_task_labels(self, task_id):
         """
         Retrieves all labels associated with the specified task.
@@ -518,28 +1132,62 @@ class TodoDatabase:
                 - DB_CONN_ERROR: Database connection error
                 - TASK_NOT_FOUND: No task found with given ID
         """
-        query = '''
-            SELECT l.* FROM labels l
-            JOIN task_labels tl ON l.id = tl.label_id
-            WHERE tl.task_id = ?
-        '''
-
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
-                # First check if task exists
-                cursor.execute('SELECT id FROM tasks WHERE id = ?', (task_id,))
-                if cursor.fetchone() is None:
+            with self._borrow_reader() as conn:
+                cursor = conn.execute(_SQL_GET_TASK_LABELS, (task_id,))
+                rows = cursor.fetchall()
+
+                # The LEFT JOINs return no rows only when the task itself is
+                # missing; a task without labels yields a single all-NULL row.
+                if not rows:
                     raise DatabaseError(f"No task found with ID {task_id}", "TASK_NOT_FOUND")
 
-                # Get the labels
-                cursor.execute(query, (task_id,))
-                return cursor.fetchall()
+                return [row for row in rows if row[0] is not None]
 
         except sqlite3.OperationalError as e:
             self.log.error("Database connection error: %s", e)
             raise DatabaseError("An error occurred while connecting to the database", "DB_CONN_ERROR") from e
 
+    def get_labels_for_tasks(self, task_ids):
+        """
+        Retrieves labels for many tasks with one query instead of one per task.
+
+        Calling get_task_labels per displayed task is the classic N+1
+        pattern; this resolves the whole set with a single join, chunked
+        only to stay under SQLite's bound-variable limit.
+
+        Args:
+            task_ids (iterable): The task IDs to fetch labels for.
+
+        Returns:
+            dict: Maps each requested task ID to a list of (id, name, color)
+                tuples. Tasks without labels map to an empty list.
+
+        Raises:
+            DatabaseError: If there is an error connecting to the database.
+        """
+        ids = list(dict.fromkeys(task_ids))
+        labels_by_task = {task_id: [] for task_id in ids}
+        if not ids:
+            return labels_by_task
+
+        try:
+            with self._borrow_reader() as conn:
+                for start in range(0, len(ids), 500):
+                    chunk = ids[start:start + 500]
+                    placeholders = ', '.join('?' * len(chunk))
+                    # skipcq: BAN-B608
+                    rows = conn.execute(
+                        'SELECT tl.task_id, l.id, l.name, l.color '
+                        'FROM labels l JOIN task_labels tl ON l.id = tl.label_id '
+                        f'WHERE tl.task_id IN ({placeholders})', chunk)
+                    for task_id, label_id, name, color in rows:
+                        labels_by_task[task_id].append((label_id, name, color))
+                return labels_by_task
+        except sqlite3.OperationalError as e:
+            self.log.error("Database connection error: %s", e)
+            raise DatabaseError("An error occurred while connecting to the database", "DB_CONN_ERROR") from e
+
     def get_all_labels(self):
         """
         Retrieves all labels from the database.
@@ -547,22 +1195,46 @@ class TodoDatabase:
         Returns:
             list: A list of tuples, where each tuple represents a label and contains the label's ID, name, and color.
         """
-        query = 'SELECT * FROM labels'
+        # Labels mutate rarely but the UI re-reads them every refresh; serve
+        # from memory until a label write bumps the rev. The cache holds a
+        # tuple and every caller gets a fresh list, so mutating a returned
+        # list cannot corrupt what later callers see.
+        if self._labels_cache_rev == self._labels_rev:
+            return list(self._labels_cache)
 
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
-                cursor.execute(query)
-                return cursor.fetchall()
+            with self._borrow_reader() as conn:
+                labels = conn.execute(_SQL_GET_ALL_LABELS).fetchall()
+                self._labels_cache = tuple(labels)
+                self._labels_cache_rev = self._labels_rev
+                return labels
         except sqlite3.OperationalError as e:
             self.log.error("Database connection error: %s", e)
             raise DatabaseError("An error occurred while connecting to the database",
                                 "DB_CONN_ERROR") from e
 
+    def _diagnose_link_failure(self, task_id, label_id):
+        """Name the missing side of a failed task-label link.
+
+        Existence is not pre-checked on the happy path; the foreign keys
+        enforce it inside the single INSERT, so these probe queries only run
+        after an IntegrityError to pick the right error code.
+        """
+        with self._borrow_reader() as conn:
+            if conn.execute(_SQL_TASK_EXISTS, (task_id,)).fetchone() is None:
+                return DatabaseError("Task not found", "TASK_NOT_FOUND")
+            if conn.execute(_SQL_LABEL_EXISTS, (label_id,)).fetchone() is None:
+                return DatabaseError(f"Label with ID {label_id} is not found",
+                                     "LABEL_NOT_FOUND")
+        return DatabaseError("An error occurred while executing the query",
+                             "DB_QUERY_ERROR")
+
     def link_task_label(self, task_id, label_id):
         """
         Links a task to a label in the database.
 
+        Linking an already-linked pair is a no-op, so the call is idempotent.
+
         Args:
             task_id (int): The ID of the task to link to the label.
             label_id (int): The ID of the label to link to the task.
@@ -571,21 +1243,57 @@ class TodoDatabase:
             DatabaseError: With codes:
                 - TASK_NOT_FOUND: If task doesn't exist
                 - LABEL_NOT_FOUND: If label doesn't exist
-                - LINK_EXISTS: If link already exists
                 - DB_CONN_ERROR: If database connection fails
         """
-        query = 'INSERT INTO task_labels (task_id, label_id) VALUES (?, ?)'
-
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                cursor = conn.cursor()
+            with self._connect() as conn:
+                conn.execute(_SQL_LINK_TASK_LABEL, (task_id, label_id))
 
-                try:
-                    cursor.execute(query, (task_id, label_id))
-                except sqlite3.IntegrityError as err:
-                    raise DatabaseError("Task-label link already exists",
-                                        "LINK_EXISTS") from err
+        except sqlite3.IntegrityError as e:
+            raise self._diagnose_link_failure(task_id, label_id) from e
+        except sqlite3.OperationalError as e:
+            self.log.error("Database connection error: %s", e)
+            raise DatabaseError("An error occurred while connecting to the database", "DB_CONN_ERROR") from e
+
+    def link_task_labels(self, pairs):
+        """
+        Links several task-label pairs in a single transaction.
+
+        The whole batch is inserted with one executemany call; pairs that
+        are already linked are ignored, so the call is idempotent.
+
+        Args:
+            pairs (iterable): (task_id, label_id) pairs to link.
 
+        Raises:
+            DatabaseError: With codes:
+                - TASK_NOT_FOUND: If any referenced task doesn't exist
+                - LABEL_NOT_FOUND: If any referenced label doesn't exist
+                - DB_CONN_ERROR: If database connection fails
+        """
+        pairs = [tuple(pair) for pair in pairs]
+        if not pairs:
+            return
+
+        try:
+            with self._connect() as conn:
+                conn.executemany(_SQL_LINK_TASK_LABEL, pairs)
+
+        except sqlite3.IntegrityError as e:
+            # The batch rolled back; probe pair by pair only on this error
+            # path to name the side that broke the foreign keys.
+            with self._borrow_reader() as conn:
+                for task_id, label_id in pairs:
+                    if conn.execute(_SQL_TASK_EXISTS, (task_id,)).fetchone() is None:
+                        raise DatabaseError("Task not found", "TASK_NOT_FOUND") from e
+                    if conn.execute(_SQL_LABEL_EXISTS, (label_id,)).fetchone() is None:
+                        raise DatabaseError(f"Label with ID {label_id} is not found",
+                                            "LABEL_NOT_FOUND") from e
+            # Every pair checked out, so the probes cannot name a culprit
+            # (e.g. a concurrent delete raced them); fall back to the same
+            # wrapped error the single-pair diagnosis uses.
+            raise DatabaseError("An error occurred while executing the query",
+                                "DB_QUERY_ERROR") from e
         except sqlite3.OperationalError as e:
             self.log.error("Database connection error: %s", e)
             raise DatabaseError("An error occurred while connecting to the database", "DB_CONN_ERROR") from e
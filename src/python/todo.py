@@ -1,11 +1,8 @@
 from python.database import TodoDatabase, DatabaseError
 from python.logging_config import setup_logging, log_execution_time, log_context
-import os
 import uuid
 import json
 
-os.makedirs("logs", exist_ok=True)
-
 log = setup_logging(__name__)
 
 
@@ -3,11 +3,8 @@ import json
 from python.todo import TodoList
 import logging
 import uuid
-import os
 from python.logging_config import setup_logging
 
-os.makedirs("logs", exist_ok=True)
-
 setup_logging(__name__)
 
 log = logging.getLogger(__name__)
@@ -2,12 +2,13 @@ import unittest
 from unittest.mock import patch, Mock, call
 import sqlite3
 from datetime import datetime
-from python.database import TodoDatabase, DatabaseError
+from python.database import TodoDatabase, DatabaseError, _close_quietly, _ensure_writable_dir, _resolve_log_dir
 import os
 import time
 import warnings
+import weakref
 from contextlib import suppress
-import sys
+import logging
 import shutil
 
 #skipcq: PTC-W0046
@@ -93,14 +94,21 @@ class BaseTodoDatabaseTest(unittest.TestCase):
     def tearDown(self):
         """Clean up after each test."""
         if hasattr(self, 'db'):
+            # close() drains the reader pool as well as the writer; a leaked
+            # reader keeps the -shm/-wal sidecars pinned on disk after the
+            # test database itself is removed.
+            self.db.close()
             del self.db
 
     @classmethod
     def tearDownClass(cls):
         """Clean up test files after all tests."""
         with suppress(Exception):
-            if os.path.exists(cls.TEST_DB_NAME):
-                os.remove(cls.TEST_DB_NAME)
+            for leftover in (cls.TEST_DB_NAME,
+                             cls.TEST_DB_NAME + '-shm',
+                             cls.TEST_DB_NAME + '-wal'):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
             if os.path.exists(cls.TEST_DB_DIR):
                 os.rmdir(cls.TEST_DB_DIR)
 
@@ -171,7 +179,7 @@ class TestTodoDatabaseAddTask(BaseTodoDatabaseTest):
         self.assertEqual(task[2], task_data['deadline'])  # deadline
         self.assertEqual(task[3], task_data['category'])  # category
         self.assertEqual(task[4], task_data['notes'])  # notes
-        self.assertEqual(task[5], task_data['priority'])  # priority
+        self.assertEqual(task[5], 1)  # priority stored as INTEGER code for HIGH
 
     def test_add_task_with_partial_fields(self):
         """Verify task creation with only some fields populated."""
@@ -221,9 +229,8 @@ class TestTodoDatabaseAddTask(BaseTodoDatabaseTest):
         """Verify that a database query error is handled correctly."""
         with patch('sqlite3.connect') as mock_connect:
             mock_conn = mock_connect.return_value
-            mock_cursor = mock_conn.cursor.return_value
             # Mock the execute method to raise a SQLite error
-            mock_cursor.execute.side_effect = sqlite3.Error("Query error")
+            mock_conn.execute.side_effect = sqlite3.Error("Query error")
             # Mock the __enter__ and __exit__ methods for context manager
             mock_conn.__enter__.return_value = mock_conn
             mock_conn.__exit__.side_effect = None
@@ -232,6 +239,96 @@ class TestTodoDatabaseAddTask(BaseTodoDatabaseTest):
                 self.db.add_task(self.BASIC_TASK_TITLE)
             self.assertEqual(cm.exception.code, "DB_QUERY_ERROR")
 
+class TestTodoDatabaseAddTasks(BaseTodoDatabaseTest):
+    """Test suite for add_tasks function in TodoDatabase class."""
+
+    TEST_DB_NAME = os.path.join(BaseTodoDatabaseTest.TEST_DB_DIR, 'test_database_add_tasks.db')
+
+    def setUp(self):
+        super().setUp()
+
+    def test_add_tasks_successful(self):
+        """Verify that a batch of tasks is inserted and IDs returned in order."""
+        task_ids = self.db.add_tasks([
+            ("Task 1",),
+            ("Task 2", None, "Work"),
+            ("Task 3", None, None, "notes", "HIGH"),
+        ])
+
+        self.assertEqual(len(task_ids), 3)
+        self.assertEqual(self.db.get_task(task_ids[0])[1], "Task 1")
+        self.assertEqual(self.db.get_task(task_ids[1])[4], "Work")
+        self.assertEqual(self.db.get_task(task_ids[2])[6], "HIGH")
+
+    def test_add_tasks_empty_batch(self):
+        """Verify that an empty batch is a no-op returning an empty list."""
+        self.assertEqual(self.db.add_tasks([]), [])
+        self.assertEqual(len(self.db.get_all_tasks()), 0)
+
+    def test_add_tasks_validates_before_inserting(self):
+        """Verify that a bad row anywhere in the batch prevents all inserts."""
+        with self.assertRaises(DatabaseError) as cm:
+            self.db.add_tasks([("Task 1",), ("",)])
+        self.assertEqual(cm.exception.code, "EMPTY_TITLE")
+        self.assertEqual(len(self.db.get_all_tasks()), 0)
+
+    def test_add_tasks_invalid_priority(self):
+        """Verify that an invalid priority in any row rejects the batch."""
+        with self.assertRaises(DatabaseError) as cm:
+            self.db.add_tasks([("Task 1", None, None, None, self.INVALID_PRIORITY)])
+        self.assertEqual(cm.exception.code, "INVALID_PRIORITY")
+
+    def test_add_tasks_db_connection_error(self):
+        """Verify that a database connection error is handled correctly."""
+        with patch('sqlite3.connect') as mock_connect:
+            mock_connect.side_effect = sqlite3.OperationalError("Unable to connect")
+            with self.assertRaises(DatabaseError) as cm:
+                self.db.add_tasks([("Task 1",)])
+            self.assertEqual(cm.exception.code, "DB_CONN_ERROR")
+
+class TestTodoDatabaseLinkTaskLabels(BaseTodoDatabaseTest):
+    """Test suite for link_task_labels function in TodoDatabase class."""
+
+    TEST_DB_NAME = os.path.join(BaseTodoDatabaseTest.TEST_DB_DIR, 'test_database_link_task_labels.db')
+
+    def setUp(self):
+        super().setUp()
+
+    def test_link_task_labels_successful(self):
+        """Verify that a batch of task-label pairs is linked in one call."""
+        task_id = self.db.add_task(self.BASIC_TASK_TITLE)
+        first_label = self.db.add_label(self.BASIC_LABEL_TITLE)
+        second_label = self.db.add_label('test label 2')
+
+        self.db.link_task_labels([(task_id, first_label), (task_id, second_label)])
+
+        labels = self.db.get_task_labels(task_id)
+        self.assertEqual({label[0] for label in labels}, {first_label, second_label})
+
+    def test_link_task_labels_empty_batch(self):
+        """Verify that an empty batch is a no-op."""
+        self.db.link_task_labels([])
+
+    def test_link_task_labels_duplicate_ignored(self):
+        """Verify that duplicate pairs in the batch are ignored, not fatal."""
+        task_id = self.db.add_task(self.BASIC_TASK_TITLE)
+        first_label = self.db.add_label(self.BASIC_LABEL_TITLE)
+        second_label = self.db.add_label('test label 2')
+        self.db.link_task_label(task_id, first_label)
+
+        self.db.link_task_labels([(task_id, second_label), (task_id, first_label)])
+
+        labels = self.db.get_task_labels(task_id)
+        self.assertEqual({label[0] for label in labels}, {first_label, second_label})
+
+    def test_link_task_labels_db_connection_error(self):
+        """Verify that a database connection error is handled correctly."""
+        with patch('sqlite3.connect') as mock_connect:
+            mock_connect.side_effect = sqlite3.OperationalError("Unable to connect")
+            with self.assertRaises(DatabaseError) as cm:
+                self.db.link_task_labels([(1, 1)])
+            self.assertEqual(cm.exception.code, "DB_CONN_ERROR")
+
 class TestTodoDatabaseDeleteTask(BaseTodoDatabaseTest):
     """Test suite for TodoDatabase class delete_task method."""
 
@@ -396,8 +493,7 @@ class TestTodoDatabaseUpdateTask(BaseTodoDatabaseTest):
     def test_update_task_db_query_error(self, mock_connect):
         """Verify that database query error is handled correctly."""
         mock_conn = mock_connect.return_value
-        mock_cursor = mock_conn.cursor.return_value
-        mock_cursor.execute.side_effect = sqlite3.Error("Query error")
+        mock_conn.execute.side_effect = sqlite3.Error("Query error")
         mock_conn.__enter__.return_value = mock_conn
         mock_conn.__exit__.side_effect = None
 
@@ -421,6 +517,14 @@ class TestTodoDatabaseMarkCompleted(BaseTodoDatabaseTest):
         task = self.db.get_task(task_id)
         self.assertTrue(task[2])
 
+    def test_mark_completed_already_completed(self):
+        """Verify that re-marking a completed task is a no-op, not an error."""
+        task_id = self.db.add_task(self.BASIC_TASK_TITLE)
+        self.db.mark_completed(task_id)
+        self.db.mark_completed(task_id)
+        task = self.db.get_task(task_id)
+        self.assertTrue(task[2])
+
     def test_mark_completed_nonexistent_task(self):
         """Verify that marking a nonexistent task as completed raises DatabaseError."""
         with self.assertRaises(DatabaseError) as cm:
@@ -491,6 +595,54 @@ class TestTodoDatabaseGetAllTasks(BaseTodoDatabaseTest):
             self.db.get_all_tasks()
         self.assertEqual(cm.exception.code, "DB_CONN_ERROR")
 
+class TestTodoDatabaseGetTaskNotes(BaseTodoDatabaseTest):
+    """Test suite for get_task_notes function in TodoDatabase class."""
+
+    TEST_DB_NAME = os.path.join(BaseTodoDatabaseTest.TEST_DB_DIR, 'test_database_get_notes.db')
+
+    def test_get_task_notes_successful(self):
+        """Verify that a task's notes can be fetched on their own."""
+        task_id = self.db.add_task(self.BASIC_TASK_TITLE, notes="Some notes")
+        self.assertEqual(self.db.get_task_notes(task_id), "Some notes")
+
+    def test_get_task_notes_defaults_to_none(self):
+        """Verify that a task without notes returns None."""
+        task_id = self.db.add_task(self.BASIC_TASK_TITLE)
+        self.assertIsNone(self.db.get_task_notes(task_id))
+
+    def test_get_task_notes_nonexistent_task(self):
+        """Verify that fetching notes for a missing task raises DatabaseError."""
+        with self.assertRaises(DatabaseError) as cm:
+            self.db.get_task_notes(9999)
+        self.assertEqual(cm.exception.code, "TASK_NOT_FOUND")
+
+class TestTodoDatabaseIterAllTasks(BaseTodoDatabaseTest):
+    """Test suite for the iter_all_tasks generator in TodoDatabase class."""
+
+    TEST_DB_NAME = os.path.join(BaseTodoDatabaseTest.TEST_DB_DIR, 'test_database_iter_all.db')
+
+    def test_iter_all_tasks_yields_all_tasks(self):
+        """Verify that iterating yields the same rows get_all_tasks returns."""
+        self.db.add_task("Task 1")
+        self.db.add_task("Task 2")
+
+        tasks = list(self.db.iter_all_tasks())
+        self.assertEqual(tasks, self.db.get_all_tasks())
+
+    def test_iter_all_tasks_supports_early_stop(self):
+        """Verify that a consumer can stop early and keep using the database."""
+        self.db.add_task("Task 1")
+        self.db.add_task("Task 2")
+        self.db.add_task("Task 3")
+
+        iterator = self.db.iter_all_tasks()
+        first = next(iterator)
+        self.assertIsNotNone(first)
+        # Close the generator so the connection lock is released
+        iterator.close()
+
+        self.assertEqual(len(self.db.get_all_tasks()), 3)
+
 class TestTodoDatabaseAddLabel(BaseTodoDatabaseTest):
     """Test suite for add_label function in TodoDatabase class."""
 
@@ -586,8 +738,7 @@ class TestTodoDatabaseAddLabel(BaseTodoDatabaseTest):
     def test_add_label_db_query_error(self, mock_connect):
         """Verify that database query error is handled correctly."""
         mock_conn = mock_connect.return_value
-        mock_cursor = mock_conn.cursor.return_value
-        mock_cursor.execute.side_effect = sqlite3.Error("Query error")
+        mock_conn.execute.side_effect = sqlite3.Error("Query error")
         mock_conn.__enter__.return_value = mock_conn
         mock_conn.__exit__.side_effect = None
 
@@ -619,12 +770,45 @@ class TestTodoDatabaseGetLabel(BaseTodoDatabaseTest):
     def test_get_label_db_connection_error(self):
         """Verify that a database connection error is handled correctly."""
         label_id = self.db.add_label(self.BASIC_LABEL_TITLE)
+        # Drop the cached connection so the patched connect is exercised
+        self.db.close()
         with patch('sqlite3.connect') as mock_connect:
             mock_connect.side_effect = sqlite3.OperationalError("Unable to connect")
             with self.assertRaises(DatabaseError) as cm:
                 self.db.get_label(label_id)
             self.assertEqual(cm.exception.code, "DB_CONN_ERROR")
 
+class TestTodoDatabaseGetLabelsForTasks(BaseTodoDatabaseTest):
+    """Test suite for get_labels_for_tasks function in TodoDatabase class."""
+
+    TEST_DB_NAME = os.path.join(BaseTodoDatabaseTest.TEST_DB_DIR, 'test_database_labels_for_tasks.db')
+
+    def test_get_labels_for_tasks_groups_by_task(self):
+        """Verify labels for several tasks come back grouped in one call."""
+        first_task = self.db.add_task("Task 1")
+        second_task = self.db.add_task("Task 2")
+        first_label = self.db.add_label("Label 1")
+        second_label = self.db.add_label("Label 2")
+        self.db.link_task_label(first_task, first_label)
+        self.db.link_task_label(first_task, second_label)
+        self.db.link_task_label(second_task, first_label)
+
+        labels = self.db.get_labels_for_tasks([first_task, second_task])
+
+        self.assertEqual({label[0] for label in labels[first_task]},
+                         {first_label, second_label})
+        self.assertEqual([label[0] for label in labels[second_task]], [first_label])
+
+    def test_get_labels_for_tasks_unlabeled_task(self):
+        """Verify a task without labels maps to an empty list."""
+        task_id = self.db.add_task(self.BASIC_TASK_TITLE)
+        labels = self.db.get_labels_for_tasks([task_id])
+        self.assertEqual(labels, {task_id: []})
+
+    def test_get_labels_for_tasks_empty_input(self):
+        """Verify an empty ID set returns an empty mapping without a query."""
+        self.assertEqual(self.db.get_labels_for_tasks([]), {})
+
 class TestTodoDatabaseDeleteLabel(BaseTodoDatabaseTest):
     """Test suite for delete_label function in TodoDatabase class."""
 
@@ -650,6 +834,8 @@ class TestTodoDatabaseDeleteLabel(BaseTodoDatabaseTest):
     def test_delete_label_db_connection_error(self):
         """Verify that a database connection error is handled correctly."""
         label_id = self.db.add_label(self.BASIC_LABEL_TITLE)
+        # Drop the cached connection so the patched connect is exercised
+        self.db.close()
         with patch('sqlite3.connect') as mock_connect:
             mock_connect.side_effect = sqlite3.OperationalError("Unable to connect")
             with self.assertRaises(DatabaseError) as cm:
@@ -687,12 +873,75 @@ class TestTodoDatabaseClearTaskLabels(BaseTodoDatabaseTest):
     def test_clear_task_labels_db_connection_error(self):
         """Verify that a database connection error is handled correctly."""
         task_id = self.db.add_task(self.BASIC_TASK_TITLE)
+        # Drop the cached connection so the patched connect is exercised
+        self.db.close()
         with patch('sqlite3.connect') as mock_connect:
             mock_connect.side_effect = sqlite3.OperationalError("Unable to connect")
             with self.assertRaises(DatabaseError) as cm:
                 self.db.clear_task_labels(task_id)
             self.assertEqual(cm.exception.code, "DB_CONN_ERROR")
 
+class TestTodoDatabaseSetTaskLabels(BaseTodoDatabaseTest):
+    """Test suite for set_task_labels function in TodoDatabase class."""
+
+    TEST_DB_NAME = os.path.join(BaseTodoDatabaseTest.TEST_DB_DIR, 'test_database_set_task_labels.db')
+
+    def setUp(self):
+        super().setUp()
+
+    def test_set_task_labels_successful(self):
+        """Verify that a task's labels can be replaced with a new set."""
+        task_id = self.db.add_task(self.BASIC_TASK_TITLE)
+        first_label = self.db.add_label(self.BASIC_LABEL_TITLE)
+        second_label = self.db.add_label('test label 2')
+        self.db.link_task_label(task_id, first_label)
+
+        self.db.set_task_labels(task_id, [second_label])
+
+        labels = self.db.get_task_labels(task_id)
+        self.assertEqual(len(labels), 1)
+        self.assertEqual(labels[0][0], second_label)
+
+    def test_set_task_labels_keeps_existing_links(self):
+        """Verify that labels already linked to the task are preserved."""
+        task_id = self.db.add_task(self.BASIC_TASK_TITLE)
+        first_label = self.db.add_label(self.BASIC_LABEL_TITLE)
+        second_label = self.db.add_label('test label 2')
+        self.db.link_task_label(task_id, first_label)
+
+        self.db.set_task_labels(task_id, [first_label, second_label])
+
+        labels = self.db.get_task_labels(task_id)
+        self.assertEqual({label[0] for label in labels}, {first_label, second_label})
+
+    def test_set_task_labels_empty_clears_labels(self):
+        """Verify that passing an empty set removes all labels from the task."""
+        task_id = self.db.add_task(self.BASIC_TASK_TITLE)
+        label_id = self.db.add_label(self.BASIC_LABEL_TITLE)
+        self.db.link_task_label(task_id, label_id)
+
+        self.db.set_task_labels(task_id, [])
+
+        labels = self.db.get_task_labels(task_id)
+        self.assertEqual(len(labels), 0)
+
+    def test_set_task_labels_nonexistent_task(self):
+        """Verify that setting labels for a non-existent task raises DatabaseError."""
+        with self.assertRaises(DatabaseError) as cm:
+            self.db.set_task_labels(9999, [1])
+        self.assertEqual(cm.exception.code, "TASK_NOT_FOUND")
+
+    def test_set_task_labels_db_connection_error(self):
+        """Verify that a database connection error is handled correctly."""
+        task_id = self.db.add_task(self.BASIC_TASK_TITLE)
+        # Drop the cached connection so the patched connect is exercised
+        self.db.close()
+        with patch('sqlite3.connect') as mock_connect:
+            mock_connect.side_effect = sqlite3.OperationalError("Unable to connect")
+            with self.assertRaises(DatabaseError) as cm:
+                self.db.set_task_labels(task_id, [1])
+            self.assertEqual(cm.exception.code, "DB_CONN_ERROR")
+
 class TestTodoDatabaseGetTaskLabels(BaseTodoDatabaseTest):
     """Test suite for get_task_labels function in TodoDatabase class."""
 
@@ -719,6 +968,8 @@ class TestTodoDatabaseGetTaskLabels(BaseTodoDatabaseTest):
     def test_get_task_labels_db_connection_error(self):
         """Verify that a database connection error is handled correctly."""
         task_id = self.db.add_task(self.BASIC_TASK_TITLE)
+        # Drop the cached connection so the patched connect is exercised
+        self.db.close()
         with patch('sqlite3.connect') as mock_connect:
             mock_connect.side_effect = sqlite3.OperationalError("Unable to connect")
             with self.assertRaises(DatabaseError) as cm:
@@ -740,6 +991,14 @@ class TestTodoDatabaseGetAllLabels(BaseTodoDatabaseTest):
         labels = self.db.get_all_labels()
         self.assertEqual(len(labels), 2)
 
+    def test_get_all_labels_returned_list_is_not_the_cache(self):
+        """Verify that mutating a returned list doesn't corrupt the cache."""
+        self.db.add_label(self.BASIC_LABEL_TITLE)
+        # Prime the cache, then take a cache hit and mutate what it returns
+        self.db.get_all_labels()
+        self.db.get_all_labels().clear()
+        self.assertEqual(len(self.db.get_all_labels()), 1)
+
     def test_get_all_labels_db_connection_error(self):
         """Verify that a database connection error is handled correctly."""
         with patch('sqlite3.connect') as mock_connect:
@@ -778,6 +1037,8 @@ class TestTodoDatabaseLinkTaskLabel(BaseTodoDatabaseTest):
         """Verify that a database connection error is handled correctly."""
         task_id = self.db.add_task(self.BASIC_TASK_TITLE)
         label_id = self.db.add_label(self.BASIC_LABEL_TITLE)
+        # Drop the cached connection so the patched connect is exercised
+        self.db.close()
         with patch('sqlite3.connect') as mock_connect:
             mock_connect.side_effect = sqlite3.OperationalError("Unable to connect")
             with self.assertRaises(DatabaseError) as cm:
@@ -789,13 +1050,66 @@ class TestTodoDatabaseLinkTaskLabel(BaseTodoDatabaseTest):
         task_id = self.db.add_task(self.BASIC_TASK_TITLE)
         label_id = self.db.add_label(self.BASIC_LABEL_TITLE)
 
-        # Link first time
+        # Link twice; the second call is an idempotent no-op
+        self.db.link_task_label(task_id, label_id)
         self.db.link_task_label(task_id, label_id)
 
-        # Link second time should raise LINK_FAILED
+        labels = self.db.get_task_labels(task_id)
+        self.assertEqual(len(labels), 1, "Duplicate link should not create a second row")
+
+    def test_link_task_label_nonexistent_task(self):
+        """Verify that linking a missing task reports TASK_NOT_FOUND."""
+        label_id = self.db.add_label(self.BASIC_LABEL_TITLE)
+
+        with self.assertRaises(DatabaseError) as cm:
+            self.db.link_task_label(99999, label_id)
+        self.assertEqual(cm.exception.code, "TASK_NOT_FOUND")
+
+    def test_link_task_label_nonexistent_label(self):
+        """Verify that linking a missing label reports LABEL_NOT_FOUND."""
+        task_id = self.db.add_task(self.BASIC_TASK_TITLE)
+
+        with self.assertRaises(DatabaseError) as cm:
+            self.db.link_task_label(task_id, 99999)
+        self.assertEqual(cm.exception.code, "LABEL_NOT_FOUND")
+
+class TestTodoDatabaseBulk(BaseTodoDatabaseTest):
+    """Test suite for the bulk transaction context manager in TodoDatabase class."""
+
+    TEST_DB_NAME = os.path.join(BaseTodoDatabaseTest.TEST_DB_DIR, 'test_database_bulk.db')
+
+    def setUp(self):
+        super().setUp()
+
+    def test_bulk_commits_all_writes(self):
+        """Verify that writes inside a bulk block are committed together."""
+        with self.db.bulk() as cursor:
+            cursor.executemany(
+                "INSERT INTO tasks (title) VALUES (?)",
+                [("Task 1",), ("Task 2",), ("Task 3",)])
+
+        tasks = self.db.get_all_tasks()
+        self.assertEqual(len(tasks), 3)
+
+    def test_bulk_rolls_back_on_error(self):
+        """Verify that an error inside a bulk block rolls back all writes."""
         with self.assertRaises(DatabaseError) as cm:
-            self.db.link_task_label(task_id, label_id)
-        self.assertEqual(cm.exception.code, "LINK_EXISTS")
+            with self.db.bulk() as cursor:
+                cursor.execute("INSERT INTO tasks (title) VALUES (?)", ("Task 1",))
+                cursor.execute("INSERT INTO tasks (title) VALUES (?)", (None,))
+        self.assertEqual(cm.exception.code, "DB_QUERY_ERROR")
+
+        tasks = self.db.get_all_tasks()
+        self.assertEqual(len(tasks), 0)
+
+    def test_bulk_db_connection_error(self):
+        """Verify that a database connection error is handled correctly."""
+        with patch('sqlite3.connect') as mock_connect:
+            mock_connect.side_effect = sqlite3.OperationalError("Unable to connect")
+            with self.assertRaises(DatabaseError) as cm:
+                with self.db.bulk():
+                    pass
+            self.assertEqual(cm.exception.code, "DB_CONN_ERROR")
 
 class TestTodoDatabaseInit(BaseTodoDatabaseTest):
     """Test suite for TodoDatabase.__init__ method."""
@@ -866,17 +1180,65 @@ class TestTodoDatabaseInit(BaseTodoDatabaseTest):
         db = TodoDatabase()
         self.assertEqual(db.db_file, 'todo.db')
 
-    @patch('os.access')
+    @patch('sqlite3.connect')
     @patch('os.makedirs')
-    def test_init_no_write_permission(self, mock_makedirs, mock_access):
-        """Verify that __init__ raises PermissionError when no write permission."""
-        mock_access.return_value = False
+    def test_init_no_write_permission(self, mock_makedirs, mock_connect):
+        """Verify that __init__ raises PermissionError when sqlite cannot open the file."""
         mock_makedirs.side_effect = None
-        
+        mock_connect.side_effect = sqlite3.OperationalError("unable to open database file")
+        # Directory creation is cached per directory; start from a cold cache
+        _ensure_writable_dir.cache_clear()
+
         with self.assertRaises(PermissionError):
             TodoDatabase(self.TEST_DB_NAME)
-        
-        mock_access.assert_called_once()
+
+    @patch('os.access')
+    @patch('os.makedirs')
+    def test_init_memory_database_skips_path_checks(self, mock_makedirs, mock_access):
+        """Verify that in-memory databases skip directory creation and access checks."""
+        db = TodoDatabase(":memory:")
+        self.assertEqual(db.db_file, ":memory:")
+
+        mock_access.assert_not_called()
+        # Only the log directory is created, never a database directory
+        for call_args in mock_makedirs.call_args_list:
+            self.assertIn("logs", call_args.args[0])
+
+    def test_init_memory_database_round_trip(self):
+        """Verify that an in-memory database actually supports task operations.
+
+        The schema must live on the shared writer connection; initializing a
+        throwaway connection would leave the real one with an empty database.
+        """
+        db = TodoDatabase(":memory:")
+        try:
+            task_id = db.add_task(self.BASIC_TASK_TITLE, priority='HIGH')
+            task = db.get_task(task_id)
+            self.assertEqual(task[1], self.BASIC_TASK_TITLE)
+            self.assertEqual(task[6], 'HIGH')
+        finally:
+            db.close()
+
+    def test_init_memory_database_iteration_allows_nested_reads(self):
+        """Verify iterating a memory database permits calls mid-iteration.
+
+        Memory reads go through the shared writer; a generator that stayed
+        paused while holding the writer lock would deadlock the nested
+        get_task_labels call below.
+        """
+        db = TodoDatabase(":memory:")
+        try:
+            first = db.add_task(self.BASIC_TASK_TITLE)
+            db.add_task("Second Task")
+            label_id = db.add_label(self.BASIC_LABEL_TITLE)
+            db.link_task_label(first, label_id)
+
+            labels_seen = [db.get_task_labels(task[0])
+                           for task in db.iter_all_tasks()]
+            self.assertEqual(len(labels_seen), 2)
+            self.assertEqual(sum(len(labels) for labels in labels_seen), 1)
+        finally:
+            db.close()
 
     def test_init_closes_connection(self):
         """Verify that __init__ closes the database connection after initialization."""
@@ -898,70 +1260,144 @@ class TestTodoDatabaseInit(BaseTodoDatabaseTest):
                 TodoDatabase(path)
             self.assertEqual(cm.exception.code, "INVALID_PATH")
 
-class TestTodoDatabaseDel(BaseTodoDatabaseTest):
-    """Test suite for TodoDatabase.__del__ method."""
+    def test_init_stamps_schema_version(self):
+        """Verify that init stamps user_version so restarts skip the DDL."""
+        db = TodoDatabase(self.TEST_DB_NAME)
+        with db._connect() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        self.assertGreaterEqual(version, 1)
+
+        # A second instance against the stamped file must still come up clean
+        db2 = TodoDatabase(self.TEST_DB_NAME)
+        task_id = db2.add_task(self.BASIC_TASK_TITLE)
+        self.assertIsNotNone(db2.get_task(task_id))
+
+    def test_init_upgrades_legacy_priority_schema(self):
+        """Verify that init rebuilds a legacy tasks table so names survive.
+
+        Baseline databases declared priority INTEGER and stored the names as
+        text; CREATE TABLE IF NOT EXISTS keeps that declaration, so without
+        the rebuild the PRIORITY converter never fires and raw values leak
+        back to callers.
+        """
+        legacy_db = os.path.join(self.TEST_DB_DIR, 'legacy.db')
+        conn = sqlite3.connect(legacy_db)
+        conn.executescript('''
+            CREATE TABLE tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                completed BOOLEAN NOT NULL DEFAULT 0,
+                deadline DATETIME,
+                category TEXT,
+                notes TEXT,
+                priority INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE TABLE labels (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT UNIQUE NOT NULL,
+                color TEXT
+            );
+            CREATE TABLE task_labels (
+                task_id INTEGER,
+                label_id INTEGER,
+                FOREIGN KEY (task_id) REFERENCES tasks (id) ON DELETE CASCADE,
+                FOREIGN KEY (label_id) REFERENCES labels (id) ON DELETE CASCADE,
+                PRIMARY KEY (task_id, label_id)
+            );
+            INSERT INTO tasks (title, priority)
+                VALUES ('legacy asap', 'ASAP'), ('legacy none', NULL);
+            INSERT INTO labels (name, color) VALUES ('work', '#fff');
+            INSERT INTO task_labels VALUES (1, 1);
+        ''')
+        conn.close()
+
+        db = TodoDatabase(legacy_db)
+        try:
+            # Old rows come back with their names, links survive the rebuild
+            self.assertEqual(db.get_task(1)[6], 'ASAP')
+            self.assertIsNone(db.get_task(2)[6])
+            self.assertEqual(len(db.get_task_labels(1)), 1)
+
+            # Rows inserted after the upgrade round-trip their names too
+            task_id = db.add_task(self.BASIC_TASK_TITLE, priority='HIGH')
+            self.assertEqual(db.get_task(task_id)[6], 'HIGH')
+        finally:
+            db.close()
 
-    TEST_DB_NAME = os.path.join(BaseTodoDatabaseTest.TEST_DB_DIR, 'test_database_del.db')
+    def test_init_invalid_synchronous_level(self):
+        """Verify that __init__ rejects unknown synchronous levels."""
+        with self.assertRaises(DatabaseError) as cm:
+            TodoDatabase(self.TEST_DB_NAME, synchronous='SOMETIMES')
+        self.assertEqual(cm.exception.code, "INVALID_VALUE")
 
-    def setUp(self):
-        self.db = TodoDatabase(self.TEST_DB_NAME)
-        super().setUp()
+    def test_init_synchronous_level_applied(self):
+        """Verify that the synchronous kwarg reaches the connection pragma."""
+        db = TodoDatabase(self.TEST_DB_NAME, synchronous='FULL')
+        with db._connect() as conn:
+            level = conn.execute("PRAGMA synchronous").fetchone()[0]
+        self.assertEqual(level, 2, "FULL should map to synchronous level 2")
 
-    def tearDown(self):
-        if hasattr(self, 'db') and self.db is not None:
-            self.db.close()
-        super().tearDown()
+class TestTodoDatabaseLifecycle(BaseTodoDatabaseTest):
+    """Test suite for TodoDatabase connection lifecycle management."""
 
-    def test_del_closes_connection_gracefully(self):
-        """Verify that __del__ closes database connection gracefully."""
-        # Create a connection explicitly
-        conn = sqlite3.connect(self.TEST_DB_NAME)
-        self.db._conn = conn
+    TEST_DB_NAME = os.path.join(BaseTodoDatabaseTest.TEST_DB_DIR, 'test_database_lifecycle.db')
 
-        # Store connection object locally
+    def test_finalizer_closes_connection_on_collection(self):
+        """Verify the finalizer closes the connection when the instance is collected."""
+        # Warm the shared connection so the finalizer is registered
+        self.db.add_task(self.BASIC_TASK_TITLE)
         test_conn = self.db._conn
+        self.assertIsNotNone(test_conn)
 
-        # Delete the database instance
+        # Drop the last reference to the database instance
         del self.db
-        self.db = None  # Ensure complete cleanup
 
         # Verify the connection is closed by trying to use it
         with self.assertRaises(sqlite3.ProgrammingError) as cm:
             test_conn.execute("SELECT 1")
         self.assertIn("Cannot operate on a closed database", str(cm.exception))
 
-    @patch('logging.error')
-    def test_del_handles_connection_error(self, mock_log_error):
-        """Verify that __del__ handles connection errors gracefully."""
-        # Create a mock connection that raises an error on close
+    def test_finalizer_swallows_close_error(self):
+        """Verify finalization ignores errors raised while closing."""
         mock_conn = Mock()
         mock_conn.close.side_effect = sqlite3.Error("Test error")
         self.db._conn = mock_conn
-        
-        # Delete the database instance
+        self.db._finalizer = weakref.finalize(self.db, _close_quietly, mock_conn)
+
+        # This should not raise any exceptions
         del self.db
-        
-        # Verify error was logged
-        mock_log_error.assert_called_once_with(
-            "Error closing database connection: %s: %s",
-            "Error",
-            "Test error"
-        )
+        mock_conn.close.assert_called_once()
+
+    def test_close_detaches_finalizer(self):
+        """Verify close() detaches the finalizer so the connection isn't closed twice."""
+        self.db.add_task(self.BASIC_TASK_TITLE)
+        finalizer = self.db._finalizer
+        self.assertTrue(finalizer.alive)
 
-    def test_del_handles_missing_connection(self):
-        """Verify that __del__ handles case when connection doesn't exist."""
+        self.db.close()
+        self.assertFalse(finalizer.alive)
+        self.assertIsNone(self.db._conn)
+
+    def test_close_without_connection(self):
+        """Verify close() is a no-op when no connection was ever opened."""
         # Ensure no connection exists
         self.db._conn = None
         # This should not raise any exceptions
-        del self.db
+        self.db.close()
+
+    def test_context_manager_closes_connection(self):
+        """Verify the context manager protocol closes the connection on exit."""
+        with TodoDatabase(self.TEST_DB_NAME) as db:
+            db.add_task(self.BASIC_TASK_TITLE)
+            test_conn = db._conn
+            self.assertIsNotNone(test_conn)
+
+        self.assertIsNone(db._conn)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            test_conn.execute("SELECT 1")
+
 
-    def test_del_handles_missing_attribute(self):
-        """Verify that __del__ handles case when _conn attribute doesn't exist."""
-        # Remove the _conn attribute
-        delattr(self.db, '_conn')
-        # This should not raise any exceptions
-        del self.db
-        
 class TestTodoDatabaseLogDirectory(BaseTodoDatabaseTest):
     """Test suite for log directory creation functionality."""
 
@@ -986,25 +1422,17 @@ class TestTodoDatabaseLogDirectory(BaseTodoDatabaseTest):
                     os.rmdir(log_dir)
 
     @patch('os.makedirs')
-    @patch('logging.FileHandler')  # Add this patch
-    def test_default_log_directory_creation(self, mock_file_handler, mock_makedirs):
+    def test_default_log_directory_creation(self, mock_makedirs):
         """Test that the default logs directory is created."""
         mock_makedirs.side_effect = None
-        mock_file_handler.return_value = Mock()
-        
-        # Patch sys.modules
-        modules_patcher = patch.dict('sys.modules', {})
-        database_patcher = patch('python.database', create=True)
-        
-        with modules_patcher, database_patcher:
-            from python.database import TodoDatabase # skipcq: PYL-W0404
-            TodoDatabase()  # Create instance to trigger directory creation
-        
+
+        log_dir = _resolve_log_dir()
+
         mock_makedirs.assert_called_with("logs", exist_ok=True)
+        self.assertEqual(log_dir, "logs")
 
     @patch('os.makedirs')
-    @patch('logging.FileHandler')  # Add this patch
-    def test_fallback_log_directory_creation(self, mock_file_handler, mock_makedirs):
+    def test_fallback_log_directory_creation(self, mock_makedirs):
         """Test that the fallback user logs directory is created when default fails."""
         user_home = os.path.expanduser("~")
         expected_calls = [
@@ -1012,24 +1440,23 @@ class TestTodoDatabaseLogDirectory(BaseTodoDatabaseTest):
             call(os.path.normpath(os.path.join(user_home, "logs")), exist_ok=True)
         ]
         mock_makedirs.side_effect = [PermissionError, None]
-        mock_file_handler.return_value = Mock()
-        
-        # Create database instance to trigger directory creation
-        TodoDatabase()
-        
+
+        log_dir = _resolve_log_dir()
+
         # Verify both directory creation attempts
         mock_makedirs.assert_has_calls(expected_calls, any_order=False)
+        self.assertEqual(log_dir, os.path.join(user_home, "logs"))
 
     @patch('logging.FileHandler')  # Add this patch
     def test_log_directory_exists_after_init(self, mock_file_handler):
         """Test that at least one log directory exists after initialization."""
-        mock_file_handler.return_value = Mock()
-        
-        # Re-import to trigger directory creation
-        with patch.dict('sys.modules'):
-            if 'python.database' in sys.modules:
-                del sys.modules['python.database']
-            from python.database import TodoDatabase  # skipcq: PYL-W0404
+        mock_file_handler.return_value = logging.NullHandler()
+
+        # Handler setup is lazy, so instantiating (not importing) the
+        # database is what triggers directory creation
+        logging.getLogger('python.database').handlers.clear()
+        db = TodoDatabase(self.TEST_DB_NAME)
+        db.close()
 
         self.assertTrue(
             os.path.exists(self.default_log_dir) or os.path.exists(self.user_log_dir),
@@ -1037,8 +1464,7 @@ class TestTodoDatabaseLogDirectory(BaseTodoDatabaseTest):
         )
 
     @patch('os.makedirs')
-    @patch('logging.FileHandler')  # Add this patch
-    def test_both_directory_creation_fails(self, mock_file_handler, mock_makedirs):
+    def test_both_directory_creation_fails(self, mock_makedirs):
         """Test behavior when both default and fallback directory creation fails."""
         # Setup expected calls
         user_home = os.path.expanduser("~")
@@ -1046,16 +1472,16 @@ class TestTodoDatabaseLogDirectory(BaseTodoDatabaseTest):
             call("logs", exist_ok=True),
             call(os.path.normpath(os.path.join(user_home, "logs")), exist_ok=True)
         ]
-        
+
         # Configure mock to always raise PermissionError
         mock_makedirs.side_effect = PermissionError
-        mock_file_handler.return_value = Mock()
-        
-        # Create database instance - should handle exceptions gracefully
-        TodoDatabase()
-        
+
+        # Should fall back to the current directory without raising
+        log_dir = _resolve_log_dir()
+
         # Verify both creation attempts were made
         mock_makedirs.assert_has_calls(expected_calls, any_order=False)
+        self.assertEqual(log_dir, ".")
 
 class TestDatabaseLogging(BaseTodoDatabaseTest):
     """Test suite for database logging functionality."""
@@ -39,7 +39,12 @@ class TestLoggingConfig(unittest.TestCase):
         """Test logging setup configuration"""
         self.assertEqual(self.logger.level, logging.INFO)
         self.assertEqual(len(self.logger.handlers), 2)
-        self.assertTrue(any(isinstance(h, logging.FileHandler) for h in self.logger.handlers))
+        # File I/O runs on a background listener behind a queue handler
+        queue_handlers = [h for h in self.logger.handlers
+                          if isinstance(h, logging.handlers.QueueHandler)]
+        self.assertEqual(len(queue_handlers), 1)
+        self.assertTrue(any(isinstance(h, logging.handlers.RotatingFileHandler)
+                            for h in queue_handlers[0].listener.handlers))
         self.assertTrue(any(isinstance(h, logging.StreamHandler) for h in self.logger.handlers))
 
     def test_log_execution_time(self):
@@ -26,6 +26,12 @@ class TestServer(unittest.TestCase):
         self.assertIn('PORT', self.app.config)
         self.assertEqual(5000, self.app.config['PORT'])
 
+    def test_health_check(self):
+        """Verify the health endpoint returns the healthy payload."""
+        response = self.client.get('/health')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {'status': 'healthy'})
+
     @staticmethod
     def test_server_not_run():
         """Test server doesn't run when not main module."""
@@ -209,7 +209,7 @@ class TestTodoListRefreshTasks(BaseTodoListTest):
             
             # Verify that error was logged multiple times due to decorators
             calls = mock_log_error.call_args_list
-            self.assertEqual(len(calls), 4)  # Expect 4 error log calls
+            self.assertEqual(len(calls), 3)  # Expect 3 error log calls
             
             # Verify the specific error messages
             self.assertTrue(any(
@@ -247,7 +247,7 @@ class TestTodoListRefreshTasks(BaseTodoListTest):
             
             # Verify that error was logged multiple times due to decorators
             calls = mock_log_error.call_args_list
-            self.assertEqual(len(calls), 4)  # Expect 4 error log calls
+            self.assertEqual(len(calls), 3)  # Expect 3 error log calls
             
             # Verify the specific error messages
             self.assertTrue(any(
@@ -414,7 +414,7 @@ class TestTodoListAddTask(BaseTodoListTest):
             
             # Verify that error was logged multiple times due to decorators
             calls = mock_log_error.call_args_list
-            self.assertEqual(len(calls), 4)  # Expect 4 error log calls
+            self.assertEqual(len(calls), 3)  # Expect 3 error log calls
             
             # Verify the specific error messages
             self.assertTrue(any(
@@ -444,7 +444,7 @@ class TestTodoListAddTask(BaseTodoListTest):
             
             # Verify that error was logged multiple times due to decorators
             calls = mock_log_error.call_args_list
-            self.assertEqual(len(calls), 4)  # Expect 4 error log calls
+            self.assertEqual(len(calls), 3)  # Expect 3 error log calls
             
             # Verify the specific error messages
             self.assertTrue(any(
@@ -531,7 +531,7 @@ class TestTodoListMarkCompleted(BaseTodoListTest):
             
             # Verify that error was logged multiple times due to decorators
             calls = mock_log_error.call_args_list
-            self.assertEqual(len(calls), 4)  # Expect 4 error log calls
+            self.assertEqual(len(calls), 3)  # Expect 3 error log calls
             
             # Verify the specific error messages
             self.assertTrue(any(
@@ -578,7 +578,7 @@ class TestTodoListMarkCompleted(BaseTodoListTest):
             
             # Verify that error was logged multiple times due to decorators
             calls = mock_log_error.call_args_list
-            self.assertEqual(len(calls), 4)  # Expect 4 error log calls
+            self.assertEqual(len(calls), 3)  # Expect 3 error log calls
             
             # Verify the specific error messages
             self.assertTrue(any(
@@ -660,7 +660,7 @@ class TestTodoListUpdateTask(BaseTodoListTest):
             
             # Verify that error was logged multiple times due to decorators
             calls = mock_log_error.call_args_list
-            self.assertEqual(len(calls), 4)  # Expect 4 error log calls
+            self.assertEqual(len(calls), 3)  # Expect 3 error log calls
             
             # Verify the specific error messages
             self.assertTrue(any(
@@ -698,7 +698,7 @@ class TestTodoListUpdateTask(BaseTodoListTest):
             
             # Verify that error was logged multiple times due to decorators
             calls = mock_log_error.call_args_list
-            self.assertEqual(len(calls), 4)  # Expect 4 error log calls
+            self.assertEqual(len(calls), 3)  # Expect 3 error log calls
             
             # Verify the specific error messages
             self.assertTrue(any(
@@ -771,7 +771,7 @@ class TestTodoListDeleteTask(BaseTodoListTest):
             
             # Verify that error was logged multiple times due to decorators
             calls = mock_log_error.call_args_list
-            self.assertEqual(len(calls), 4)  # Expect 4 error log calls
+            self.assertEqual(len(calls), 3)  # Expect 3 error log calls
             
             # Verify the specific error messages
             self.assertTrue(any(
@@ -808,7 +808,7 @@ class TestTodoListDeleteTask(BaseTodoListTest):
             
             # Verify that error was logged multiple times due to decorators
             calls = mock_log_error.call_args_list
-            self.assertEqual(len(calls), 4)  # Expect 4 error log calls
+            self.assertEqual(len(calls), 3)  # Expect 3 error log calls
             
             # Verify the specific error messages
             self.assertTrue(any(
@@ -848,7 +848,7 @@ class TestTodoListDeleteTask(BaseTodoListTest):
             
             # Verify that error was logged multiple times due to decorators
             calls = mock_log_error.call_args_list
-            self.assertEqual(len(calls), 4)  # Expect 4 error log calls
+            self.assertEqual(len(calls), 3)  # Expect 3 error log calls
             
             # Verify the specific error messages
             self.assertTrue(any(